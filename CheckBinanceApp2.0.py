@@ -1,22 +1,89 @@
-import os
+import asyncio
 import json
+import re
+import time
+from collections import namedtuple
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import numpy as np
 import requests
-from binance.client import Client
-from binance.exceptions import BinanceAPIException
-import pandas as pd
-from ta.trend import MACD, ADXIndicator
-from ta.momentum import RSIIndicator
-from ta.volatility import AverageTrueRange
+from requests.adapters import HTTPAdapter
+
+try:
+    import keyring
+except ImportError:
+    keyring = None
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QLineEdit, QPushButton, QVBoxLayout, QHBoxLayout,
     QTextEdit, QMessageBox, QGroupBox, QGridLayout, QComboBox, QProgressDialog
 )
 from PyQt5.QtGui import QPalette, QColor, QFont
-from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QThread, pyqtSignal
+
+Klines = namedtuple("Klines", ["high", "low", "close", "volume"])
+
+# Endpoint klines công khai, không cần chữ ký HMAC.
+FAPI_KLINES_URL = "https://fapi.binance.com/fapi/v1/klines"
+
+_INTERVAL_SECONDS = {"4h": 4 * 3600, "1d": 24 * 3600}
+_CACHE_DIR = Path.home() / ".cache" / "binance_klines"
+
+_KEYRING_SERVICE = "CheckBinanceApp"
+
+# Tách danh sách mã một lần bằng regex biên dịch sẵn, nuốt luôn khoảng
+# trắng quanh dấu phẩy thay vì strip từng phần tử.
+_SYMBOL_SPLIT = re.compile(r"\s*,\s*")
+
+_GREEN_BUTTON_STYLE = "background-color: #4caf50; color: white;"
+_BLUE_BUTTON_STYLE = "background-color: #2196f3; color: white;"
+_RESULT_TEXT_STYLE = "background-color: #2b2b2b; color: white;"
+
+
+def build_dark_palette():
+    palette = QPalette()
+    palette.setColor(QPalette.Window, QColor(53, 53, 53))
+    palette.setColor(QPalette.WindowText, Qt.white)
+    palette.setColor(QPalette.Base, QColor(25, 25, 25))
+    palette.setColor(QPalette.Text, Qt.white)
+    palette.setColor(QPalette.Button, QColor(53, 53, 53))
+    palette.setColor(QPalette.ButtonText, Qt.white)
+    palette.setColor(QPalette.Highlight, QColor(142, 45, 197).lighter())
+    palette.setColor(QPalette.HighlightedText, Qt.black)
+    return palette
+
+# Bảng tra (xu hướng, tín hiệu) theo mã trạng thái 4 bit:
+# bit3 = adx > 25, bit2 = adx < 20, bit1 = macd > signal,
+# bit0 = rsi cho phép vào lệnh theo hướng của macd.
+# Trước đây các ô "xu hướng mạnh nhưng rsi chặn lệnh" bị bỏ trống,
+# khiến luồng phân tích chết vì unpack None; giờ mọi ô đều có kết quả.
+_STATES = (
+    ("Không ổn định", "không"),  # 0b0000
+    ("Không ổn định", "không"),  # 0b0001
+    ("Không ổn định", "không"),  # 0b0010
+    ("Không ổn định", "không"),  # 0b0011
+    ("Đi ngang", "không"),       # 0b0100
+    ("Đi ngang", "không"),       # 0b0101
+    ("Đi ngang", "không"),       # 0b0110
+    ("Đi ngang", "không"),       # 0b0111
+    ("Không rõ", "không"),       # 0b1000: xu hướng mạnh, rsi chặn bán
+    ("Giảm", "bán"),             # 0b1001
+    ("Không rõ", "không"),       # 0b1010: xu hướng mạnh, rsi chặn mua
+    ("Tăng", "mua"),             # 0b1011
+    ("Không rõ", "không"),       # 0b1100 (adx không thể vừa >25 vừa <20)
+    ("Không rõ", "không"),       # 0b1101
+    ("Không rõ", "không"),       # 0b1110
+    ("Không rõ", "không"),       # 0b1111
+)
 
 
 class MarketAnalysisThread(QThread):
     analysis_complete = pyqtSignal(dict)
+    progress = pyqtSignal(int, int)
+
+    # Cache dùng chung giữa các lần bấm nút; key đã chứa bucket thời
+    # gian nên dữ liệu cũ tự hết hạn khi sang nến mới.
+    _mem_cache = {}
 
     def __init__(self, client, symbols, interval):
         super().__init__()
@@ -25,12 +92,50 @@ class MarketAnalysisThread(QThread):
         self.interval = interval
 
     def run(self):
+        # Import ở đây thay vì đầu file: kéo theo numba và phần warmup
+        # JIT, nên để lần bấm nút đầu tiên trả giá trên luồng phụ thay
+        # vì bắt cửa sổ chờ lúc khởi động.
+        from indicators import analyze_batch
+
         results = {}
-        for symbol in self.symbols:
-            data = self.get_historical_data(symbol)
-            if data is not None and not data.empty:
-                trend, signal = self.market_analysis(data)
-                decision = self.trading_decision(data, trend, signal)
+        fetched = self.fetch_klines()
+
+        batch = []
+        for symbol, data in fetched:
+            if len(data.close) < 50:
+                results[symbol] = {
+                    "trend": "Dữ liệu không đủ",
+                    "signal": "không",
+                    "decision": self.trading_decision(data, "không", 0.0)
+                }
+            else:
+                batch.append((symbol, data))
+
+        if batch:
+            # Xếp dữ liệu các mã thành các ma trận (N, số nến) liền kề
+            # để một kernel numba duyệt tất cả trong một lần gọi, vòng
+            # prange chia các hàng cho nhiều lõi CPU.
+            width = max(len(data.close) for _, data in batch)
+            H = np.zeros((len(batch), width), dtype=np.float64)
+            L = np.zeros((len(batch), width), dtype=np.float64)
+            C = np.zeros((len(batch), width), dtype=np.float64)
+            lengths = np.empty(len(batch), dtype=np.int64)
+            for i, (_, data) in enumerate(batch):
+                m = len(data.close)
+                H[i, :m] = data.high
+                L[i, :m] = data.low
+                C[i, :m] = data.close
+                lengths[i] = m
+            out = analyze_batch(H, L, C, lengths)
+            for i, (symbol, data) in enumerate(batch):
+                macd_up = int(out[i, 0] > out[i, 1])
+                # macd chạm đúng signal thì không có hướng: ép bit0 về 0
+                # để rơi vào ô trung tính thay vì bị tính là tín hiệu bán.
+                macd_moves = int(out[i, 0] != out[i, 1])
+                rsi_ok = macd_moves * (macd_up * int(out[i, 3] < 70) + (1 - macd_up) * int(out[i, 3] > 30))
+                code = (int(out[i, 2] > 25) << 3) | (int(out[i, 2] < 20) << 2) | (macd_up << 1) | rsi_ok
+                trend, signal = _STATES[code]
+                decision = self.trading_decision(data, signal, out[i, 4])
                 results[symbol] = {
                     "trend": trend,
                     "signal": signal,
@@ -38,61 +143,161 @@ class MarketAnalysisThread(QThread):
                 }
         self.analysis_complete.emit(results)
 
-    def get_historical_data(self, symbol):
+    def fetch_klines(self):
+        """Tải klines cho mọi mã cùng lúc, trả về list (mã, Klines)."""
+        fetched = []
+        misses = []
+        for symbol in self.symbols:
+            data = self.load_cached(symbol)
+            if data is not None:
+                fetched.append((symbol, data))
+            else:
+                misses.append(symbol)
+        # Mỗi mã xong (kể cả trúng cache) đẩy một nấc tiến độ thật.
+        self._done = len(fetched)
+        self.progress.emit(self._done, len(self.symbols))
+        if not misses:
+            return fetched
+
         try:
-            klines = self.client.futures_klines(symbol=symbol, interval=self.interval, limit=100)
-            data = pd.DataFrame(klines, columns=[
-                "timestamp", "open", "high", "low", "close", "volume", 
-                "close_time", "quote_asset_volume", "number_of_trades", 
-                "taker_buy_base_asset_volume", "taker_buy_quote_asset_volume", "ignore"
-            ])
-            data["close"] = pd.to_numeric(data["close"])
-            data["high"] = pd.to_numeric(data["high"])
-            data["low"] = pd.to_numeric(data["low"])
-            data["volume"] = pd.to_numeric(data["volume"])
+            import aiohttp  # noqa: F401 — chỉ kiểm tra có sẵn hay không
+            has_aiohttp = True
+        except ImportError:
+            has_aiohttp = False
+
+        if has_aiohttp:
+            # Gọi thẳng endpoint công khai qua aiohttp + gather: một
+            # event loop thay cho N luồng, vẫn chỉ tốn ~1 vòng HTTPS.
+            payloads = asyncio.run(self._fetch_all(misses))
+            for symbol, payload in zip(misses, payloads):
+                if isinstance(payload, list) and len(payload) > 0:
+                    data = self.parse_klines(payload)
+                    self.store_cached(symbol, data)
+                    fetched.append((symbol, data))
+        else:
+            # Mỗi lần gọi API là một vòng HTTPS riêng nên tải song song
+            # để tổng thời gian chờ chỉ bằng một lần gọi thay vì N lần.
+            with ThreadPoolExecutor(max_workers=len(misses)) as executor:
+                futures = {
+                    executor.submit(self.get_historical_data, symbol): symbol
+                    for symbol in misses
+                }
+                for future in as_completed(futures):
+                    symbol = futures[future]
+                    data = future.result()
+                    self._done += 1
+                    self.progress.emit(self._done, len(self.symbols))
+                    if data is not None and len(data.close) > 0:
+                        self.store_cached(symbol, data)
+                        fetched.append((symbol, data))
+        return fetched
+
+    async def _fetch_all(self, symbols):
+        import aiohttp
+
+        async def fetch(session, symbol):
+            params = {"symbol": symbol, "interval": self.interval, "limit": 100}
+            try:
+                async with session.get(FAPI_KLINES_URL, params=params) as resp:
+                    return await resp.json()
+            finally:
+                # Tick cả khi lỗi, như nhánh thread pool, để thanh tiến
+                # độ luôn chạy được tới đích dù có mã tải hỏng.
+                self._done += 1
+                self.progress.emit(self._done, len(self.symbols))
+
+        async with aiohttp.ClientSession() as session:
+            tasks = [fetch(session, symbol) for symbol in symbols]
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _cache_key(self, symbol):
+        bucket = int(time.time()) // _INTERVAL_SECONDS.get(self.interval, 3600)
+        return f"{symbol}:{self.interval}:{bucket}"
+
+    def load_cached(self, symbol):
+        key = self._cache_key(symbol)
+        data = self._mem_cache.get(key)
+        if data is not None:
             return data
-        except BinanceAPIException as e:
+        path = _CACHE_DIR / (key.replace(":", "_") + ".npz")
+        try:
+            with np.load(path) as f:
+                data = Klines(f["high"], f["low"], f["close"], f["volume"])
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # File hỏng (ghi dở, rỗng, không phải zip...) đọc lên sẽ ném
+            # đủ loại lỗi khác nhau: coi như miss và xóa để khỏi vấp lại
+            # suốt phần còn lại của nến.
+            path.unlink(missing_ok=True)
             return None
+        self._mem_cache[key] = data
+        return data
+
+    def store_cached(self, symbol, data):
+        key = self._cache_key(symbol)
+        self._mem_cache[key] = data
+        path = _CACHE_DIR / (key.replace(":", "_") + ".npz")
+        tmp = path.with_name(path.name + ".tmp")
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Ghi ra file tạm rồi đổi tên nguyên tử để không bao giờ để
+            # lại file .npz cụt nếu app bị tắt giữa chừng.
+            with open(tmp, "wb") as f:
+                np.savez(f, high=data.high, low=data.low, close=data.close, volume=data.volume)
+            tmp.replace(path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
 
-    def market_analysis(self, data):
-        if len(data) < 50:
-            return "Dữ liệu không đủ", "không"
-
-        macd = MACD(close=data["close"])
-        adx = ADXIndicator(high=data["high"], low=data["low"], close=data["close"])
-        rsi = RSIIndicator(close=data["close"])
-
-        latest_macd = macd.macd().iloc[-1]
-        latest_signal = macd.macd_signal().iloc[-1]
-        adx_value = adx.adx().iloc[-1]
-        rsi_value = rsi.rsi().iloc[-1]
-
-        if adx_value > 25:
-            if latest_macd > latest_signal and rsi_value < 70:
-                return "Tăng", "mua"
-            elif latest_macd < latest_signal and rsi_value > 30:
-                return "Giảm", "bán"
-        elif adx_value < 20:
-            return "Đi ngang", "không"
-        else:
-            return "Không ổn định", "không"
+    def get_historical_data(self, symbol):
+        from binance.exceptions import BinanceAPIException
 
-    def trading_decision(self, data, trend, signal):
-        close_price = data["close"].iloc[-1]
-        atr = AverageTrueRange(high=data["high"], low=data["low"], close=data["close"])
-        latest_atr = atr.average_true_range().iloc[-1]
+        try:
+            klines = self.client.futures_klines(symbol=symbol, interval=self.interval, limit=100)
+            return self.parse_klines(klines)
+        except BinanceAPIException as e:
+            return None
 
+    def parse_klines(self, klines):
+        # Chỉ cần 4 cột high/low/close/volume; Binance trả số dưới dạng
+        # chuỗi nên để np.asarray chuyển cả cột trong C một lượt thay vì
+        # gọi float() 400 lần (4 cột x 100 nến) từ Python.
+        high = np.asarray([k[2] for k in klines], dtype=np.float64)
+        low = np.asarray([k[3] for k in klines], dtype=np.float64)
+        close = np.asarray([k[4] for k in klines], dtype=np.float64)
+        volume = np.asarray([k[5] for k in klines], dtype=np.float64)
+        return Klines(high, low, close, volume)
+
+    def trading_decision(self, data, signal, latest_atr):
         if signal == "mua":
-            tp = close_price + latest_atr * 2
-            sl = close_price - latest_atr * 2
-            return f"Mở lệnh mua.\n - Chốt lời (TP): {tp:.8f}\n - Cắt lỗ (SL): {sl:.8f}"
+            side = 1.0
         elif signal == "bán":
-            tp = close_price - latest_atr * 2
-            sl = close_price + latest_atr * 2
-            return f"Mở lệnh bán.\n - Chốt lời (TP): {tp:.8f}\n - Cắt lỗ (SL): {sl:.8f}"
+            side = -1.0
         else:
             return "Không khuyến nghị hành động."
 
+        close_price = data.close[-1]
+        delta = side * latest_atr * 2.0
+        tp = close_price + delta
+        sl = close_price - delta
+        return f"Mở lệnh {signal}.\n - Chốt lời (TP): {tp:.8f}\n - Cắt lỗ (SL): {sl:.8f}"
+
+
+class IPCheckThread(QThread):
+    done = pyqtSignal(str)
+
+    def __init__(self, session):
+        super().__init__()
+        self.session = session
+
+    def run(self):
+        try:
+            ip_info = self.session.get("https://api64.ipify.org?format=json", timeout=3).json()
+            ip_address = ip_info.get("ip", "Unknown")
+            self.done.emit(f"Địa chỉ IP: {ip_address}")
+        except:
+            self.done.emit("Không thể kiểm tra IP. Vui lòng kiểm tra kết nối mạng.")
+
 
 class BinanceApp(QWidget):
     def __init__(self):
@@ -103,35 +308,39 @@ class BinanceApp(QWidget):
         self.api_key = None
         self.api_secret = None
         self.client = None
+        # Một Session dùng chung để các lần gọi HTTPS tái sử dụng kết
+        # nối keep-alive thay vì bắt tay TCP+TLS lại từ đầu mỗi lần.
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
         self.load_api_credentials()
         self.check_ip()
 
-    def init_ui(self):
-        # Chế độ tối
-        self.apply_dark_theme()
+    def check_ip(self):
+        # Gọi HTTP trên luồng riêng để cửa sổ hiện ra ngay, không phải
+        # chờ hết một vòng HTTPS (cùng mẫu với MarketAnalysisThread).
+        self.ip_thread = IPCheckThread(self.session)
+        self.ip_thread.done.connect(self.ip_label.setText)
+        self.ip_thread.start()
 
-        font = QFont()
-        font.setPointSize(10)
+    def init_ui(self):
+        # Chế độ tối và cỡ chữ đã áp ở mức QApplication nên các widget
+        # con tự kế thừa, không phải setFont/setPalette từng cái.
 
         # Hiển thị IP
         self.ip_label = QLabel("Địa chỉ IP: Đang kiểm tra...")
-        self.ip_label.setFont(font)
 
         # Nhóm thông tin API
         api_group = QGroupBox("Thông tin API")
         api_layout = QGridLayout()
         self.api_key_input = QLineEdit()
         self.api_key_input.setPlaceholderText("Nhập API Key")
-        self.api_key_input.setFont(font)
 
         self.api_secret_input = QLineEdit()
         self.api_secret_input.setPlaceholderText("Nhập API Secret")
         self.api_secret_input.setEchoMode(QLineEdit.Password)
-        self.api_secret_input.setFont(font)
 
         self.check_api_button = QPushButton("Xác minh API Key và Secret")
-        self.check_api_button.setFont(font)
-        self.check_api_button.setStyleSheet("background-color: #4caf50; color: white;")
+        self.check_api_button.setStyleSheet(_GREEN_BUTTON_STYLE)
         self.check_api_button.clicked.connect(self.check_api_validity)
 
         api_layout.addWidget(QLabel("API Key:"), 0, 0)
@@ -147,16 +356,13 @@ class BinanceApp(QWidget):
 
         self.symbol_input = QLineEdit()
         self.symbol_input.setPlaceholderText("Nhập mã đồng coin (cách nhau bằng dấu phẩy, tối đa 10 đồng, ví dụ: BTCUSDT, ETHUSDT)")
-        self.symbol_input.setFont(font)
 
         self.interval_combo = QComboBox()
         self.interval_combo.addItems(["4h", "1d"])
-        self.interval_combo.setFont(font)
         self.interval_combo.setCurrentIndex(0)
 
         self.analyze_button = QPushButton("Phân Tích Dữ Liệu")
-        self.analyze_button.setFont(font)
-        self.analyze_button.setStyleSheet("background-color: #2196f3; color: white;")
+        self.analyze_button.setStyleSheet(_BLUE_BUTTON_STYLE)
         self.analyze_button.clicked.connect(self.analyze_market)
 
         market_layout.addWidget(QLabel("Đồng Coin:"), 0, 0)
@@ -169,8 +375,7 @@ class BinanceApp(QWidget):
         # Hiển thị kết quả
         self.result_text = QTextEdit()
         self.result_text.setReadOnly(True)
-        self.result_text.setFont(font)
-        self.result_text.setStyleSheet("background-color: #2b2b2b; color: white;")
+        self.result_text.setStyleSheet(_RESULT_TEXT_STYLE)
 
         # Layout chính
         main_layout = QVBoxLayout()
@@ -182,40 +387,45 @@ class BinanceApp(QWidget):
 
         self.setLayout(main_layout)
 
-    def apply_dark_theme(self):
-        palette = QPalette()
-        palette.setColor(QPalette.Window, QColor(53, 53, 53))
-        palette.setColor(QPalette.WindowText, Qt.white)
-        palette.setColor(QPalette.Base, QColor(25, 25, 25))
-        palette.setColor(QPalette.Text, Qt.white)
-        palette.setColor(QPalette.Button, QColor(53, 53, 53))
-        palette.setColor(QPalette.ButtonText, Qt.white)
-        palette.setColor(QPalette.Highlight, QColor(142, 45, 197).lighter())
-        palette.setColor(QPalette.HighlightedText, Qt.black)
-        self.setPalette(palette)
-
-    def check_ip(self):
-        try:
-            ip_info = requests.get("https://api64.ipify.org?format=json").json()
-            ip_address = ip_info.get("ip", "Unknown")
-            self.ip_label.setText(f"Địa chỉ IP: {ip_address}")
-        except:
-            self.ip_label.setText("Không thể kiểm tra IP. Vui lòng kiểm tra kết nối mạng.")
-
     def load_api_credentials(self):
-        if os.path.exists("api_credentials.txt"):
-            with open("api_credentials.txt", "r") as file:
-                data = json.load(file)
-                self.api_key = data.get("api_key")
-                self.api_secret = data.get("api_secret")
-                self.api_key_input.setText(self.api_key)
-                self.api_secret_input.setText(self.api_secret)
+        # Ưu tiên kho khóa của hệ điều hành; file JSON chỉ còn là đường
+        # dự phòng (và để di trú cấu hình cũ) khi chưa cài keyring.
+        if keyring is not None:
+            try:
+                self.api_key = keyring.get_password(_KEYRING_SERVICE, "api_key")
+                self.api_secret = keyring.get_password(_KEYRING_SERVICE, "api_secret")
+            except Exception:
+                pass
+        if not self.api_key:
+            try:
+                data = json.loads(Path("api_credentials.txt").read_bytes())
+            except FileNotFoundError:
+                return
+            self.api_key = data.get("api_key")
+            self.api_secret = data.get("api_secret")
+        if self.api_key:
+            self.api_key_input.setText(self.api_key)
+        if self.api_secret:
+            self.api_secret_input.setText(self.api_secret)
 
     def save_api_credentials(self):
+        if keyring is not None:
+            try:
+                keyring.set_password(_KEYRING_SERVICE, "api_key", self.api_key)
+                keyring.set_password(_KEYRING_SERVICE, "api_secret", self.api_secret)
+                # Đã vào kho khóa thì xóa bản rõ còn sót trên đĩa.
+                Path("api_credentials.txt").unlink(missing_ok=True)
+                return
+            except Exception:
+                pass
         with open("api_credentials.txt", "w") as file:
             json.dump({"api_key": self.api_key, "api_secret": self.api_secret}, file)
 
     def check_api_validity(self):
+        # python-binance chỉ cần khi người dùng thực sự xác minh API.
+        from binance.client import Client
+        from binance.exceptions import BinanceAPIException
+
         self.api_key = self.api_key_input.text()
         self.api_secret = self.api_secret_input.text()
         if not self.api_key or not self.api_secret:
@@ -223,6 +433,9 @@ class BinanceApp(QWidget):
             return
 
         self.client = Client(self.api_key, self.api_secret)
+        # Client của python-binance đã giữ sẵn một session; nới rộng
+        # pool để 10 luồng tải klines song song không phải chờ socket.
+        self.client.session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
         try:
             self.client.futures_account_balance()
             QMessageBox.information(self, "Thành Công", "API Key và Secret hợp lệ.")
@@ -236,39 +449,51 @@ class BinanceApp(QWidget):
             return
 
         symbols_input = self.symbol_input.text().strip().upper()
-        symbols = [s.strip() for s in symbols_input.split(",") if s.strip()]
-        
+        symbols = [s for s in _SYMBOL_SPLIT.split(symbols_input) if s]
+
+
         if len(symbols) == 0 or len(symbols) > 10:
             QMessageBox.critical(self, "Lỗi", "Vui lòng nhập từ 1 đến 10 đồng coin.")
             return
 
         interval = self.interval_combo.currentText()
 
-        # Hiển thị hiệu ứng đang tải
-        progress_dialog = QProgressDialog("Đang tải dữ liệu...", "Hủy", 0, 0, self)
-        progress_dialog.setWindowModality(Qt.WindowModal)
-        progress_dialog.setValue(0)
-        QTimer.singleShot(1000, lambda: progress_dialog.setValue(50))
+        # Thanh tiến độ phản ánh số mã đã tải thật sự, mỗi mã một nấc
+        self.progress_dialog = QProgressDialog("Đang tải dữ liệu...", "Hủy", 0, len(symbols), self)
+        self.progress_dialog.setWindowModality(Qt.WindowModal)
+        self.progress_dialog.setValue(0)
 
         self.result_text.clear()
         self.analysis_thread = MarketAnalysisThread(self.client, symbols, interval)
+        self.analysis_thread.progress.connect(self.update_progress)
         self.analysis_thread.analysis_complete.connect(self.display_results)
         self.analysis_thread.start()
 
-        progress_dialog.show()
+        self.progress_dialog.show()
+
+    def update_progress(self, done, total):
+        self.progress_dialog.setMaximum(total)
+        self.progress_dialog.setValue(done)
 
     def display_results(self, results):
-        output = ""
+        self.progress_dialog.close()
+        # Gom từng đoạn vào list rồi join một lần; cộng dồn chuỗi bằng
+        # += sao chép lại toàn bộ chuỗi sau mỗi mã.
+        parts = []
         for symbol, analysis in results.items():
-            output += f"Phân tích cho {symbol}:\n" \
-                      f" - Xu hướng thị trường: {analysis['trend']}\n" \
-                      f" - Tín hiệu giao dịch: {analysis['signal']}\n" \
-                      f" - Kết luận: {analysis['decision']}\n\n"
-        self.result_text.setText(output)
+            parts.append(f"Phân tích cho {symbol}:\n"
+                         f" - Xu hướng thị trường: {analysis['trend']}\n"
+                         f" - Tín hiệu giao dịch: {analysis['signal']}\n"
+                         f" - Kết luận: {analysis['decision']}\n")
+        self.result_text.setText("\n".join(parts))
 
 
 if __name__ == "__main__":
     app = QApplication([])
+    app.setPalette(build_dark_palette())
+    font = QFont()
+    font.setPointSize(10)
+    app.setFont(font)
     window = BinanceApp()
     window.show()
     app.exec_()
@@ -0,0 +1,151 @@
+"""Tính nhanh các chỉ báo kỹ thuật (MACD, RSI, ADX, ATR) bằng numba.
+
+Thư viện ta tạo DataFrame/Series đầy đủ cho từng chỉ báo rồi chỉ lấy
+giá trị cuối, rất tốn bộ nhớ. Các hàm ở đây duyệt mảng numpy một lần
+và trả về đúng giá trị cuối cùng cần cho phân tích.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    # Không có numba thì các kernel chạy thuần Python trên cùng mã
+    # nguồn: chậm hơn nhưng cho kết quả y hệt, khỏi cần thư viện ta.
+    _HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+
+# Chữ ký tường minh để numba biên dịch ngay khi import thay vì ở lần
+# gọi đầu tiên; cache=True lưu mã đã biên dịch nên từ lần chạy thứ hai
+# trở đi không còn mất vài giây khởi động JIT nữa.
+
+@njit("float64(float64[::1], int64)", cache=True, fastmath=True)
+def _ewm_last(arr, span):
+    alpha = 2.0 / (span + 1.0)
+    ema = arr[0]
+    for i in range(1, arr.shape[0]):
+        ema = alpha * arr[i] + (1.0 - alpha) * ema
+    return ema
+
+
+@njit("UniTuple(float64, 2)(float64[::1])", cache=True, fastmath=True)
+def _macd_last(close):
+    n = close.shape[0]
+    a12 = 2.0 / 13.0
+    a26 = 2.0 / 27.0
+    e12 = close[0]
+    e26 = close[0]
+    macd = np.empty(n, dtype=np.float64)
+    macd[0] = 0.0
+    for i in range(1, n):
+        e12 = a12 * close[i] + (1.0 - a12) * e12
+        e26 = a26 * close[i] + (1.0 - a26) * e26
+        macd[i] = e12 - e26
+    return macd[n - 1], _ewm_last(macd, 9)
+
+
+@njit("float64(float64[::1], int64)", cache=True)
+def _rsi_last(close, n):
+    alpha = 1.0 / n
+    diff = close[1] - close[0]
+    avg_gain = diff if diff > 0.0 else 0.0
+    avg_loss = -diff if diff < 0.0 else 0.0
+    for i in range(2, close.shape[0]):
+        diff = close[i] - close[i - 1]
+        gain = diff if diff > 0.0 else 0.0
+        loss = -diff if diff < 0.0 else 0.0
+        avg_gain = alpha * gain + (1.0 - alpha) * avg_gain
+        avg_loss = alpha * loss + (1.0 - alpha) * avg_loss
+    if avg_loss == 0.0:
+        return 100.0
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+@njit("UniTuple(float64, 2)(float64[::1], float64[::1], float64[::1], int64)", cache=True, fastmath=True)
+def _adx_atr_last(high, low, close, n):
+    # ADX và ATR cùng cần chuỗi True Range nên tính tr một lần rồi
+    # làm mượt Wilder cho cả tr lẫn +DM/-DM trong cùng một vòng lặp.
+    m = high.shape[0]
+    atr = 0.0
+    sdm_p = 0.0
+    sdm_m = 0.0
+    adx = 0.0
+    dx_count = 0
+    for i in range(1, m):
+        hl = high[i] - low[i]
+        hc = abs(high[i] - close[i - 1])
+        lc = abs(low[i] - close[i - 1])
+        tr = max(hl, max(hc, lc))
+        up = high[i] - high[i - 1]
+        down = low[i - 1] - low[i]
+        dm_p = up if (up > down and up > 0.0) else 0.0
+        dm_m = down if (down > up and down > 0.0) else 0.0
+        if i == 1:
+            atr = tr
+            sdm_p = dm_p
+            sdm_m = dm_m
+        else:
+            atr = (atr * (n - 1) + tr) / n
+            sdm_p = (sdm_p * (n - 1) + dm_p) / n
+            sdm_m = (sdm_m * (n - 1) + dm_m) / n
+        if i >= n and atr > 0.0:
+            di_p = 100.0 * sdm_p / atr
+            di_m = 100.0 * sdm_m / atr
+            di_sum = di_p + di_m
+            dx = 100.0 * abs(di_p - di_m) / di_sum if di_sum > 0.0 else 0.0
+            if dx_count == 0:
+                adx = dx
+            else:
+                adx = (adx * (n - 1) + dx) / n
+            dx_count += 1
+    return adx, atr
+
+
+def analyze_last(high, low, close):
+    """Trả về (macd, signal, adx, rsi, atr) tại nến cuối cùng."""
+    macd, signal = _macd_last(close)
+    adx, atr = _adx_atr_last(high, low, close, 14)
+    rsi = _rsi_last(close, 14)
+    return macd, signal, adx, rsi, atr
+
+
+@njit("float64[:, ::1](float64[:, ::1], float64[:, ::1], float64[:, ::1], int64[::1])",
+      cache=True, parallel=True)
+def analyze_batch(H, L, C, lengths):
+    """Phân tích N mã trong một lần gọi trên các mảng (N, số nến).
+
+    Hàng i chỉ dùng lengths[i] nến đầu; vòng prange chạy song song
+    trên nhiều lõi vì mã LLVM sinh ra không giữ GIL. Trả về ma trận
+    (N, 5) gồm (macd, signal, adx, rsi, atr) cho từng mã.
+    """
+    n = H.shape[0]
+    out = np.empty((n, 5), dtype=np.float64)
+    for i in prange(n):
+        m = lengths[i]
+        macd, signal = _macd_last(C[i, :m])
+        adx, atr = _adx_atr_last(H[i, :m], L[i, :m], C[i, :m], 14)
+        out[i, 0] = macd
+        out[i, 1] = signal
+        out[i, 2] = adx
+        out[i, 3] = _rsi_last(C[i, :m], 14)
+        out[i, 4] = atr
+    return out
+
+
+def _warmup():
+    """Gọi thử từng kernel để numba ghi file cache .nbi/.nbc ra đĩa."""
+    dummy = np.zeros(50, dtype=np.float64)
+    analyze_last(dummy, dummy, dummy)
+    grid = np.zeros((1, 50), dtype=np.float64)
+    analyze_batch(grid, grid, grid, np.full(1, 50, dtype=np.int64))
+
+
+if _HAS_NUMBA:
+    _warmup()